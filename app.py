@@ -3,12 +3,16 @@ Streamlit UI for RAG Chatbot
 Provides interactive interface with memory feature and monthly spending chart.
 """
 
+# Imported first so its BLAS/OpenMP thread limits apply before NumPy is loaded
+from chatbot import initialize_rag_system, retrieve_transactions, generate_answer
 import streamlit as st
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import pandas as pd
+import io
 import logging
+import os
 from datetime import datetime
-from chatbot import initialize_rag_system, retrieve_transactions, generate_answer
+from utils import load_json, sum_by_group, to_columnar
 import json
 
 # Set up logging
@@ -35,14 +39,31 @@ if 'texts' not in st.session_state:
     st.session_state.texts = None
 if 'raw_data' not in st.session_state:
     st.session_state.raw_data = None
+if 'index' not in st.session_state:
+    st.session_state.index = None
 if 'error_message' not in st.session_state:
     st.session_state.error_message = None
 
-def load_transaction_data():
-    """Load transaction data from JSON file."""
+TRANSACTIONS_PATH = "transactions.json"
+
+def get_data_mtime():
+    """Return the transaction file's modification time, or None if it is missing."""
     try:
-        with open("transactions.json", 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return os.path.getmtime(TRANSACTIONS_PATH)
+    except OSError:
+        return None
+
+@st.cache_data
+def load_transaction_data(mtime):
+    """
+    Load transaction data from JSON file.
+    
+    Args:
+        mtime: File modification time; only used as the cache key so that
+            edits to the file invalidate the cached data
+    """
+    try:
+        return load_json(TRANSACTIONS_PATH)
     except FileNotFoundError:
         st.error("❌ Transaction data file not found. Please ensure 'transactions.json' exists.")
         logger.error("Transaction data file not found")
@@ -56,33 +77,36 @@ def load_transaction_data():
         logger.error(f"Unexpected error loading transaction data: {e}")
         return []
 
-def create_monthly_spending_chart(data):
+@st.cache_data
+def create_monthly_spending_chart(_data, mtime):
     """
-    Create a bar chart showing monthly spending.
+    Create a bar chart showing monthly spending, rendered to PNG bytes.
+    
+    The PNG (not the Figure) is cached, so sessions never share a mutable
+    matplotlib object.
     
     Args:
-        data: List of transaction dictionaries
+        _data: List of transaction dictionaries (not hashed by the cache)
+        mtime: File modification time the data was loaded from, used as the cache key
     """
+    data = _data
     try:
         if not data:
             st.warning("No transaction data available for chart.")
             return None
             
-        # Convert to DataFrame for easier manipulation
-        df = pd.DataFrame(data)
-        if df.empty:
-            st.warning("No transaction data available for chart.")
-            return None
-            
-        df['date'] = pd.to_datetime(df['date'])
-        df['month'] = df['date'].dt.to_period('M').astype(str)
+        # Convert to column arrays; dates are parsed once into "YYYY-MM" months
+        columns = to_columnar(data)
         
         # Group by month and sum amounts
-        monthly_spending = df.groupby('month')['amount'].sum().reset_index()
-        monthly_spending.columns = ['Month', 'Total Amount']
+        monthly_spending = pd.DataFrame({
+            'Month': columns['month_names'],
+            'Total Amount': sum_by_group(columns['amounts'], columns['month_ids'], len(columns['month_names'])),
+        })
         
-        # Create the chart
-        fig, ax = plt.subplots(figsize=(10, 6))
+        # Create the chart; Figure is used directly to avoid pyplot's global state
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
         ax.bar(monthly_spending['Month'], monthly_spending['Total Amount'], 
                color='steelblue', edgecolor='navy', alpha=0.7)
         ax.set_xlabel('Month', fontsize=12, fontweight='bold')
@@ -94,9 +118,12 @@ def create_monthly_spending_chart(data):
         for i, v in enumerate(monthly_spending['Total Amount']):
             ax.text(i, v, f'₹{v:,}', ha='center', va='bottom', fontweight='bold')
         
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        return fig
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
+        
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png')
+        return buffer.getvalue()
     except Exception as e:
         st.error(f"❌ Error creating monthly spending chart: {str(e)}")
         logger.error(f"Error creating monthly spending chart: {e}")
@@ -136,7 +163,8 @@ def main():
         try:
             with st.spinner("Loading transaction data and initializing AI model..."):
                 st.session_state.model, st.session_state.embeddings, \
-                st.session_state.texts, st.session_state.raw_data = initialize_rag()
+                st.session_state.texts, st.session_state.raw_data, \
+                st.session_state.index = initialize_rag()
                 st.session_state.rag_initialized = True
             st.success("✅ System ready!")
         except Exception as e:
@@ -188,7 +216,8 @@ def main():
                 answer = generate_answer(
                     user_query,
                     context,
-                    st.session_state.raw_data
+                    st.session_state.raw_data,
+                    st.session_state.index
                 )
             
             # Display answer
@@ -213,11 +242,12 @@ def main():
     # Monthly spending chart
     st.subheader("📊 Monthly Spending Chart")
     try:
-        transaction_data = load_transaction_data()
+        data_mtime = get_data_mtime()
+        transaction_data = load_transaction_data(data_mtime)
         if transaction_data:
-            chart_fig = create_monthly_spending_chart(transaction_data)
-            if chart_fig:
-                st.pyplot(chart_fig)
+            chart_png = create_monthly_spending_chart(transaction_data, data_mtime)
+            if chart_png:
+                st.image(chart_png)
         else:
             st.info("No transaction data available to display chart.")
     except Exception as e:
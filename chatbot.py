@@ -11,12 +11,57 @@ Why "all-MiniLM-L6-v2" works:
 - It's a standard SentenceTransformer model with proper PyTorch weights
 - Compatible with CPU-only environments
 - Works with the standard SentenceTransformer loading mechanism
+
+Why backend="onnx":
+- The same repository ships dynamically int8-quantized ONNX exports
+- ONNX Runtime runs them with fused, int8 CPU kernels, so encoding is faster
+- If ONNX Runtime is unavailable we fall back to the PyTorch weights
+
+Why an optional Model2Vec static model:
+- Distilling all-MiniLM-L6-v2 with Model2Vec yields a static token-embedding table
+- Encoding becomes a token lookup plus mean pooling, with no transformer layers
+- When the distilled directory exists it replaces the transformer encoder entirely
 """
 
+import hashlib
 import json
 import logging
+import os
+import re
+from functools import lru_cache
+from operator import itemgetter
+
+def _thread_count() -> int:
+    """
+    Pick the thread count from RAG_NUM_THREADS, then OMP_NUM_THREADS, then min(4, cpus).
+    
+    Values that are not positive integers are logged and skipped.
+    """
+    for var in ("RAG_NUM_THREADS", "OMP_NUM_THREADS"):
+        value = os.environ.get(var)
+        if not value:
+            continue
+        try:
+            count = int(value)
+        except ValueError:
+            count = 0
+        if count > 0:
+            return count
+        logging.getLogger(__name__).warning(f"Ignoring invalid {var}={value!r}")
+    return min(4, os.cpu_count() or 1)
+
+# Cap BLAS/OpenMP threads before NumPy and torch create their thread pools;
+# oversubscribing a small container hurts per-query latency
+NUM_THREADS = _thread_count()
+for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+    os.environ.setdefault(_var, str(NUM_THREADS))
+
 import numpy as np
-from typing import List, Dict, Tuple
+import torch
+from typing import List, Dict, Optional, Tuple
+from utils import load_json, sum_amounts, sum_by_group, to_columnar
+
+torch.set_num_threads(NUM_THREADS)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -24,6 +69,70 @@ logger = logging.getLogger(__name__)
 
 # Model configuration
 MODEL_NAME = "all-MiniLM-L6-v2"
+ONNX_MODEL_FILE = "onnx/model_qint8_avx512.onnx"
+EMBEDDING_BATCH_SIZE = 64
+EMBEDDINGS_CACHE_DIR = ".embeddings_cache"
+STATIC_MODEL_PATH = "m2v_mini"
+
+# Month names and abbreviations -> "YYYY-MM" keys of the transaction data.
+# Spelled out in English rather than taken from calendar, which follows the locale.
+MONTH_YEAR = 2024
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June",
+               "July", "August", "September", "October", "November", "December"]
+MONTHS = {alias: f"{MONTH_YEAR}-{month:02d}"
+          for month, name in enumerate(MONTH_NAMES, 1)
+          for alias in (name.lower(), name[:3].lower())}
+# "may" is also an ordinary word, so only accept it after a cue ("in may") or
+# before a year ("may 2024"). Longest alternatives first so "february" is not cut to "feb".
+MONTH_RE = re.compile(
+    r"\b(?:(" + "|".join(sorted((m for m in MONTHS if m != "may"), key=len, reverse=True)) + r")"
+    r"|(?:in|during|for|of)\s+(may)|(may)(?=\s+\d{4}))\b")
+
+def find_month(query_lower: str) -> Optional[str]:
+    """
+    Find the first month mentioned in a lowercased query.
+    
+    Args:
+        query_lower: Lowercased user question
+        
+    Returns:
+        "YYYY-MM" key of the month, or None if no month is mentioned
+    """
+    match = MONTH_RE.search(query_lower)
+    if not match:
+        return None
+    return MONTHS[next(group for group in match.groups() if group)]
+
+def use_static_model() -> bool:
+    """Return True if a distilled Model2Vec model is available at STATIC_MODEL_PATH."""
+    return os.path.isdir(STATIC_MODEL_PATH)
+
+def embedding_model_id() -> str:
+    """Return an identifier for the encoder that load_embedding_model will use."""
+    return f"model2vec:{STATIC_MODEL_PATH}" if use_static_model() else MODEL_NAME
+
+def load_embedding_model() -> object:
+    """
+    Load the SentenceTransformer model.
+    
+    Uses the distilled Model2Vec static model if present, otherwise the
+    quantized ONNX backend of MODEL_NAME.
+    
+    Returns:
+        SentenceTransformer model (static embeddings, ONNX Runtime backend,
+        or PyTorch as fallback)
+    """
+    from sentence_transformers import SentenceTransformer
+    if use_static_model():
+        from sentence_transformers.models import StaticEmbedding
+        # Wrapped in SentenceTransformer so the encode() API stays identical
+        return SentenceTransformer(modules=[StaticEmbedding.from_model2vec(STATIC_MODEL_PATH)])
+    try:
+        return SentenceTransformer(MODEL_NAME, backend="onnx",
+                                   model_kwargs={"file_name": ONNX_MODEL_FILE})
+    except Exception as e:
+        logger.warning(f"ONNX backend unavailable for {MODEL_NAME}, using PyTorch: {e}")
+        return SentenceTransformer(MODEL_NAME)
 
 def load_and_prepare(json_path: str = "transactions.json") -> Tuple[List[Dict], List[str]]:
     """
@@ -38,14 +147,12 @@ def load_and_prepare(json_path: str = "transactions.json") -> Tuple[List[Dict],
         - text_descriptions: List of formatted transaction strings
     """
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            raw_data = json.load(f)
+        raw_data = load_json(json_path)
         
-        text_descriptions = []
-        for transaction in raw_data:
-            # Format: "On 2024-01-12, Amit purchased a Laptop for 55000."
-            text = f"On {transaction['date']}, {transaction['customer']} purchased a {transaction['product']} for {transaction['amount']}."
-            text_descriptions.append(text)
+        # Format: "On 2024-01-12, Amit purchased a Laptop for 55000."
+        get_fields = itemgetter('date', 'customer', 'product', 'amount')
+        text_descriptions = [f"On {date}, {customer} purchased a {product} for {amount}."
+                             for date, customer, product, amount in map(get_fields, raw_data)]
         
         return raw_data, text_descriptions
     except FileNotFoundError:
@@ -58,6 +165,45 @@ def load_and_prepare(json_path: str = "transactions.json") -> Tuple[List[Dict],
         logger.error(f"Unexpected error loading transaction data: {e}")
         return [], []
 
+def embeddings_cache_path(json_path: str) -> str:
+    """
+    Build the on-disk embeddings cache path for a transactions file.
+    
+    Args:
+        json_path: Path to the transactions JSON file
+        
+    Returns:
+        Path of the form <cache dir>/emb_<hash>.f16.npy, keyed by the file contents
+        and the encoder so that any change produces a new cache entry
+    """
+    digest = hashlib.sha256()
+    with open(json_path, 'rb') as f:
+        digest.update(f.read())
+    digest.update(embedding_model_id().encode('utf-8'))
+    return os.path.join(EMBEDDINGS_CACHE_DIR, f"emb_{digest.hexdigest()[:16]}.f16.npy")
+
+def save_array(path: str, array: np.ndarray) -> bool:
+    """
+    Atomically save a numpy array, logging (not raising) on failure.
+    
+    Args:
+        path: Destination .npy path
+        array: Array to save
+        
+    Returns:
+        True if the file was written, False otherwise
+    """
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Write to a private temp file first so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(tmp_path, array)
+        os.replace(tmp_path, path)
+        return True
+    except OSError as e:
+        logger.warning(f"Could not write cache file {path}: {e}")
+        return False
+
 def create_embeddings(texts: List[str]) -> Tuple[object, np.ndarray]:
     """
     Create embeddings for transaction texts using SentenceTransformer.
@@ -68,35 +214,104 @@ def create_embeddings(texts: List[str]) -> Tuple[object, np.ndarray]:
     Returns:
         Tuple of (model, embeddings)
         - model: The loaded SentenceTransformer model
-        - embeddings: numpy array of embeddings (n_samples, embedding_dim)
+        - embeddings: L2-normalized float32 array of embeddings (n_samples, embedding_dim)
     """
     try:
-        from sentence_transformers import SentenceTransformer
-        model = SentenceTransformer(MODEL_NAME)
-        embeddings = model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
+        model = load_embedding_model()
+        # encode() sorts texts by length before batching, so padding stays small;
+        # normalize_embeddings folds the L2 norm into the same pass
+        embeddings = model.encode(texts, batch_size=EMBEDDING_BATCH_SIZE, convert_to_numpy=True,
+                                  normalize_embeddings=True, show_progress_bar=False)
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
         return model, embeddings
     except Exception as e:
-        logger.error(f"Error creating embeddings with model {MODEL_NAME}: {e}")
+        logger.error(f"Error creating embeddings with model {embedding_model_id()}: {e}")
         raise
 
-def cosine_similarity_matrix(query_emb, doc_embs):
+def load_retrieval_index(cache_path: str, n_rows: int) -> Optional[torch.Tensor]:
+    """
+    Load a cached float16 retrieval matrix as a shared memory map.
+    
+    Args:
+        cache_path: .npy path written by build_retrieval_index
+        n_rows: Expected number of rows (one per transaction)
+        
+    Returns:
+        float16 torch tensor (n, d) backed by the file, or None if it is missing,
+        unreadable or stale, in which case the corpus should be re-encoded
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        # Copy-on-write keeps the map writable for torch; we never write, so pages stay shared
+        matrix = np.load(cache_path, mmap_mode='c')
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable embeddings cache {cache_path}: {e}")
+        return None
+    if matrix.dtype != np.float16 or matrix.ndim != 2 or len(matrix) != n_rows:
+        logger.warning(f"Ignoring stale embeddings cache {cache_path}")
+        return None
+    return torch.from_numpy(matrix)
+
+def build_retrieval_index(embeddings: np.ndarray, cache_path: Optional[str] = None) -> torch.Tensor:
+    """
+    Convert L2-normalized document embeddings into a float16 tensor for scoring.
+    
+    When cache_path is given, the float16 matrix is stored there and the tensor
+    is backed by a memory map of that file, so every process serving the app
+    shares one physical copy through the OS page cache.
+    
+    Args:
+        embeddings: L2-normalized float32 embeddings matrix (n, d)
+        cache_path: Optional .npy path for the float16 matrix
+        
+    Returns:
+        Contiguous float16 torch tensor (n, d)
+    """
+    matrix = np.ascontiguousarray(embeddings).astype(np.float16)
+    if cache_path and save_array(cache_path, matrix):
+        # Reopen as a memory map so this process shares the page cache as well
+        return load_retrieval_index(cache_path, len(matrix))
+    return torch.from_numpy(matrix)
+
+def cosine_similarity_matrix(query_emb, doc_index):
     """
     Calculate cosine similarity between query embedding and document embeddings.
     
     Args:
         query_emb: Query embedding vector (d,)
-        doc_embs: Document embeddings matrix (n, d)
+        doc_index: float16 tensor (n, d) built by build_retrieval_index from
+            L2-normalized document embeddings
         
     Returns:
         Similarity scores array (n,)
     """
-    # Normalize vectors for cosine similarity calculation
-    query_norm = query_emb / np.linalg.norm(query_emb)
-    doc_norms = doc_embs / np.linalg.norm(doc_embs, axis=1, keepdims=True)
-    sims = doc_norms @ query_norm
+    # Document rows are normalized at build time; only the query needs it
+    query_norm = query_emb / (np.linalg.norm(query_emb) + 1e-12)
+    query_t = torch.from_numpy(query_norm.astype(np.float16))
+    
+    # Half precision is enough since only the ranking of the top-k matters
+    sims = (doc_index @ query_t).to(torch.float32).numpy()
     return sims
 
-def retrieve_transactions(query: str, model: object, embeddings: np.ndarray, 
+@lru_cache(maxsize=512)
+def _encode_query(model: object, query: str) -> np.ndarray:
+    """
+    Encode a single query string, caching the result per (model, query).
+    
+    Args:
+        model: SentenceTransformer model for encoding queries
+        query: User's question/query string
+        
+    Returns:
+        Read-only query embedding vector (d,)
+    """
+    query_embedding = model.encode([query], convert_to_numpy=True)[0]
+    # Cached arrays are shared between callers, so guard against in-place edits
+    query_embedding.setflags(write=False)
+    return query_embedding
+
+def retrieve_transactions(query: str, model: object, embeddings: torch.Tensor, 
                          texts: List[str], top_k: int = 3) -> List[Tuple[str, float]]:
     """
     Retrieve top-k most relevant transactions using cosine similarity.
@@ -104,7 +319,7 @@ def retrieve_transactions(query: str, model: object, embeddings: np.ndarray,
     Args:
         query: User's question/query string
         model: SentenceTransformer model for encoding queries
-        embeddings: Pre-computed embeddings for all transactions
+        embeddings: float16 retrieval index for all transactions
         texts: List of transaction text descriptions
         top_k: Number of top results to return
         
@@ -122,13 +337,17 @@ def retrieve_transactions(query: str, model: object, embeddings: np.ndarray,
             return []
         
         # Encode the query
-        query_embedding = model.encode([query], convert_to_numpy=True)
+        query_embedding = _encode_query(model, query)
         
         # Calculate cosine similarity
-        similarities = cosine_similarity_matrix(query_embedding[0], embeddings)
+        similarities = cosine_similarity_matrix(query_embedding, embeddings)
         
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:min(top_k, len(similarities))]
+        # Get top-k indices: partial selection, then order only the k winners
+        k = min(top_k, len(similarities))
+        if k <= 0:
+            return []
+        top_indices = np.argpartition(-similarities, k - 1)[:k]
+        top_indices = top_indices[np.argsort(-similarities[top_indices])]
         
         # Return top-k texts with their similarity scores
         results = [(texts[idx], float(similarities[idx])) for idx in top_indices]
@@ -137,7 +356,156 @@ def retrieve_transactions(query: str, model: object, embeddings: np.ndarray,
         logger.error(f"Error retrieving transactions: {e}")
         return []
 
-def generate_answer(query: str, context: List[Tuple[str, float]], raw_data: List[Dict]) -> str:
+def format_customer_answer(customer: Optional[str], intent: str,
+                           transactions: List[Dict], total) -> str:
+    """
+    Format a total-spending or purchase-history answer.
+    
+    Args:
+        customer: Canonical customer name, or None for all customers
+        intent: 'total' or 'history'
+        transactions: The customer's transactions (all transactions if customer is None)
+        total: Sum of the transactions' amounts
+        
+    Returns:
+        Answer string
+    """
+    if customer is None:
+        return f"Total spending across all customers is ₹{total}."
+    if intent == 'total':
+        return f"{customer}'s total spending is ₹{total}. They made {len(transactions)} transaction(s):\n" + \
+               "\n".join([f"- {t['product']} for ₹{t['amount']} on {t['date']}" for t in transactions])
+    if not transactions:
+        return f"No purchases found for {customer}."
+    return (f"{customer}'s purchase history:\n" + "".join(
+        f"- On {t['date']}, purchased {t['product']} for ₹{t['amount']}\n" for t in transactions)).strip()
+
+def build_transaction_index(raw_data: List[Dict], precompute_answers: bool = True) -> Dict:
+    """
+    Precompute lookup tables over the transaction data for answer generation.
+    
+    Args:
+        raw_data: Original transaction data
+        precompute_answers: Whether to compute totals and preformat every answer;
+            without them generate_answer formats only the answer it needs
+        
+    Returns:
+        Dictionary of lookup tables
+        - customers_lower: normalized customer name (lowercased word tokens joined by
+          single spaces, as in find_customer) -> canonical customer name
+        - max_name_words: number of words in the longest customer name
+        - by_customer: customer name -> row indices into raw_data
+        - by_month: "YYYY-MM" -> row indices into raw_data
+        - totals_by_customer: customer name -> total amount spent (if precompute_answers)
+        - grand_total: total amount across all transactions (if precompute_answers)
+        - answers: (customer name, 'total' | 'history') -> preformatted answer,
+          plus (None, 'total') for the all-customer total (if precompute_answers)
+    """
+    customers_lower = {}
+    by_customer = {}
+    by_month = {}
+    for i, t in enumerate(raw_data):
+        customer = t['customer']
+        customers_lower[normalize_name(customer)] = customer
+        by_customer.setdefault(customer, []).append(i)
+        by_month.setdefault(t['date'][:7], []).append(i)
+    
+    max_name_words = max((len(name.split()) for name in customers_lower), default=1)
+    index = {
+        'customers_lower': customers_lower,
+        'max_name_words': max_name_words,
+        'by_customer': by_customer,
+        'by_month': by_month,
+    }
+    if not precompute_answers:
+        return index
+    
+    # Per-customer totals in one compiled pass over the amount column; dates
+    # are not parsed here so a malformed date cannot stop the chatbot starting
+    columns = to_columnar(raw_data, include_dates=False)
+    # The column has one dtype for the whole dataset, so only an all-integer column
+    # gives every customer the same total type as a plain sum of their own rows
+    integer_amounts = np.issubdtype(columns['amounts'].dtype, np.integer)
+    if integer_amounts:
+        totals = sum_by_group(columns['amounts'], columns['customer_ids'], len(columns['customer_names']))
+        totals_by_customer = {name: total.item() for name, total in zip(columns['customer_names'], totals)}
+        grand_total = columns['amounts'].sum().item()
+    else:
+        totals_by_customer = {customer: sum_amounts([raw_data[i] for i in rows])
+                              for customer, rows in by_customer.items()}
+        grand_total = sum_amounts(raw_data)
+    
+    # Preformat the per-customer answers once so queries are a dict lookup
+    answers = {(None, 'total'): format_customer_answer(None, 'total', raw_data, grand_total)}
+    for customer, rows in by_customer.items():
+        transactions = [raw_data[i] for i in rows]
+        for intent in ('total', 'history'):
+            answers[(customer, intent)] = format_customer_answer(
+                customer, intent, transactions, totals_by_customer[customer])
+    
+    index.update({
+        'totals_by_customer': totals_by_customer,
+        'grand_total': grand_total,
+        'answers': answers,
+    })
+    return index
+
+def customer_answer(customer: Optional[str], intent: str, raw_data: List[Dict], index: Dict) -> str:
+    """
+    Look up a precomputed customer answer, formatting it on demand if needed.
+    
+    Args:
+        customer: Canonical customer name, or None for all customers
+        intent: 'total' or 'history'
+        raw_data: Original transaction data
+        index: Lookup tables from build_transaction_index
+        
+    Returns:
+        Answer string
+    """
+    answers = index.get('answers')
+    if answers is not None and (customer, intent) in answers:
+        return answers[(customer, intent)]
+    transactions = raw_data if customer is None else \
+        [raw_data[i] for i in index['by_customer'].get(customer, [])]
+    return format_customer_answer(customer, intent, transactions, sum_amounts(transactions))
+
+def normalize_name(text: str) -> str:
+    """
+    Normalize text into lowercased word tokens joined by single spaces.
+    
+    Args:
+        text: Customer name or query fragment
+        
+    Returns:
+        Normalized string, e.g. "O'Brien" -> "o brien", "Riya  Sharma" -> "riya sharma"
+    """
+    return " ".join(re.findall(r"\w+", text.lower()))
+
+def find_customer(query_lower: str, index: Dict) -> Optional[str]:
+    """
+    Find the first customer mentioned in a lowercased query.
+    
+    Args:
+        query_lower: Lowercased user question
+        index: Lookup tables from build_transaction_index
+        
+    Returns:
+        Canonical customer name, or None if no customer is mentioned
+    """
+    customers_lower = index['customers_lower']
+    # Word tokens, so "amit's" still yields "amit"; names are tokenized the same way
+    tokens = normalize_name(query_lower).split()
+    for start in range(len(tokens)):
+        # Try longer names first so "riya sharma" wins over "riya"
+        for n in range(min(index['max_name_words'], len(tokens) - start), 0, -1):
+            candidate = " ".join(tokens[start:start + n])
+            if candidate in customers_lower:
+                return customers_lower[candidate]
+    return None
+
+def generate_answer(query: str, context: List[Tuple[str, float]], raw_data: List[Dict],
+                    index: Optional[Dict] = None) -> str:
     """
     Generate an answer based on the query and retrieved context.
     Handles specific query types like total spending and customer history.
@@ -146,6 +514,8 @@ def generate_answer(query: str, context: List[Tuple[str, float]], raw_data: List
         query: User's question
         context: List of (text, similarity_score) tuples from retrieval
         raw_data: Original transaction data for calculations
+        index: Lookup tables from build_transaction_index; if omitted, only the
+            cheap lookups are built and answers are formatted per query
         
     Returns:
         Generated answer string
@@ -155,69 +525,36 @@ def generate_answer(query: str, context: List[Tuple[str, float]], raw_data: List
             return "Invalid query provided."
             
         query_lower = query.lower()
+        if index is None:
+            logger.warning("generate_answer called without an index; pass the one from initialize_rag_system")
+            index = build_transaction_index(raw_data, precompute_answers=False)
         
         # Extract customer name if mentioned
-        customer_name = None
-        for transaction in raw_data:
-            if transaction['customer'].lower() in query_lower:
-                customer_name = transaction['customer']
-                break
+        customer_name = find_customer(query_lower, index)
         
         # Handle total spending queries
         if "total spending" in query_lower or "total spent" in query_lower or "total amount" in query_lower:
-            if customer_name:
-                total = sum(t['amount'] for t in raw_data if t['customer'] == customer_name)
-                transactions = [t for t in raw_data if t['customer'] == customer_name]
-                return f"{customer_name}'s total spending is ₹{total}. They made {len(transactions)} transaction(s):\n" + \
-                       "\n".join([f"- {t['product']} for ₹{t['amount']} on {t['date']}" for t in transactions])
-            else:
-                total = sum(t['amount'] for t in raw_data)
-                return f"Total spending across all customers is ₹{total}."
+            return customer_answer(customer_name, 'total', raw_data, index)
         
         # Handle purchase history queries
         if "purchase history" in query_lower or "purchases" in query_lower or "bought" in query_lower:
             if customer_name:
-                transactions = [t for t in raw_data if t['customer'] == customer_name]
-                if transactions:
-                    result = f"{customer_name}'s purchase history:\n"
-                    for t in transactions:
-                        result += f"- On {t['date']}, purchased {t['product']} for ₹{t['amount']}\n"
-                    return result.strip()
-                else:
-                    return f"No purchases found for {customer_name}."
+                return customer_answer(customer_name, 'history', raw_data, index)
             else:
                 return "Please specify a customer name to view their purchase history."
         
         # Handle date/month filtering queries
-        if "february" in query_lower or "feb" in query_lower:
-            feb_transactions = [t for t in raw_data if "2024-02" in t['date']]
-            if feb_transactions:
-                result = "February 2024 transactions:\n"
-                for t in feb_transactions:
+        month_key = find_month(query_lower)
+        if month_key:
+            month_label = f"{MONTH_NAMES[int(month_key[5:]) - 1]} {month_key[:4]}"
+            month_transactions = [raw_data[i] for i in index['by_month'].get(month_key, [])]
+            if month_transactions:
+                result = f"{month_label} transactions:\n"
+                for t in month_transactions:
                     result += f"- {t['customer']} purchased {t['product']} for ₹{t['amount']} on {t['date']}\n"
                 return result.strip()
             else:
-                return "No transactions found for February 2024."
-        
-        if "january" in query_lower or "jan" in query_lower:
-            jan_transactions = [t for t in raw_data if "2024-01" in t['date']]
-            if jan_transactions:
-                result = "January 2024 transactions:\n"
-                for t in jan_transactions:
-                    result += f"- {t['customer']} purchased {t['product']} for ₹{t['amount']} on {t['date']}\n"
-                return result.strip()
-            else:
-                return "No transactions found for January 2024."
-        
-        if "march" in query_lower or "mar" in query_lower:
-            mar_transactions = [t for t in raw_data if "2024-03" in t['date']]
-            if mar_transactions:
-                result = "March 2024 transactions:\n"
-                for t in mar_transactions:
-                    result += f"- {t['customer']} purchased {t['product']} for ₹{t['amount']} on {t['date']}\n"
-                return result.strip()
-            else:
-                return "No transactions found for March 2024."
+                return f"No transactions found for {month_label}."
         
         # Default: Use retrieved context to generate answer
         if context:
@@ -231,7 +568,7 @@ def generate_answer(query: str, context: List[Tuple[str, float]], raw_data: List
         logger.error(f"Error generating answer: {e}")
         return "An error occurred while generating the answer. Please try again."
 
-def initialize_rag_system(json_path: str = "transactions.json") -> Tuple[object, np.ndarray, List[str], List[Dict]]:
+def initialize_rag_system(json_path: str = "transactions.json") -> Tuple[object, torch.Tensor, List[str], List[Dict], Dict]:
     """
     Initialize the complete RAG system by loading data and creating embeddings.
     
@@ -239,19 +576,30 @@ def initialize_rag_system(json_path: str = "transactions.json") -> Tuple[object,
         json_path: Path to the transactions JSON file
         
     Returns:
-        Tuple of (model, embeddings, texts, raw_data)
+        Tuple of (model, embeddings, texts, raw_data, index)
         - model: SentenceTransformer model
-        - embeddings: Transaction embeddings
+        - embeddings: float16 retrieval index of transaction embeddings
         - texts: Transaction text descriptions
         - raw_data: Original transaction data
+        - index: Lookup tables for answer generation
     """
     try:
         raw_data, texts = load_and_prepare(json_path)
         if not raw_data:
             raise ValueError("Failed to load transaction data")
             
-        model, embeddings = create_embeddings(texts)
-        return model, embeddings, texts, raw_data
+        cache_path = embeddings_cache_path(json_path)
+        embeddings = load_retrieval_index(cache_path, len(texts))
+        if embeddings is None:
+            model, embeddings = create_embeddings(texts)
+            embeddings = build_retrieval_index(embeddings, cache_path)
+        else:
+            logger.info(f"Loaded cached embeddings from {cache_path}")
+            model = load_embedding_model()
+            # Nothing was encoded, so run a dummy batch to select kernels before the first query
+            model.encode(["warmup"] * 4, batch_size=4, show_progress_bar=False)
+        index = build_transaction_index(raw_data)
+        return model, embeddings, texts, raw_data, index
     except Exception as e:
         logger.error(f"Error initializing RAG system: {e}")
         raise
\ No newline at end of file